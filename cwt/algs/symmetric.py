@@ -10,11 +10,88 @@ from ..const import COSE_KEY_OPERATION_VALUES
 from ..cose_key_interface import COSEKeyInterface
 from ..exceptions import DecodeError, EncodeError, VerifyError
 
+try:
+    from cryptography.hazmat.bindings.openssl.binding import Binding
+
+    _openssl = Binding()
+    _ffi: Any = _openssl.ffi
+    _lib: Any = _openssl.lib
+    # Recent cryptography releases no longer expose these through their
+    # (private) bindings; the native path is then disabled.
+    if not all(
+        hasattr(_lib, name)
+        for name in (
+            "EVP_get_cipherbyname",
+            "EVP_CIPHER_CTX_new",
+            "EVP_CIPHER_CTX_free",
+            "EVP_CIPHER_CTX_reset",
+            "EVP_CipherInit_ex",
+            "EVP_CipherUpdate",
+            "ERR_clear_error",
+        )
+    ):
+        raise ImportError("OpenSSL EVP bindings for AES key wrap are not available.")
+    _EVP_AES_WRAP_CIPHERS: Dict[Any, Any] = {
+        alg: cipher
+        for alg, cipher in (
+            (-3, _lib.EVP_get_cipherbyname(b"id-aes128-wrap")),
+            (-4, _lib.EVP_get_cipherbyname(b"id-aes192-wrap")),
+            (-5, _lib.EVP_get_cipherbyname(b"id-aes256-wrap")),
+        )
+        if cipher != _ffi.NULL
+    }
+except Exception:  # pragma: no cover
+    _EVP_AES_WRAP_CIPHERS = {}
+
 _CWT_DEFAULT_KEY_SIZE_HMAC256 = 32  # bytes
 _CWT_DEFAULT_KEY_SIZE_HMAC384 = 48
 _CWT_DEFAULT_KEY_SIZE_HMAC512 = 64
 _CWT_NONCE_SIZE_AESGCM = 12
 _CWT_NONCE_SIZE_CHACHA20_POLY1305 = 12
+_KW_KEY_LEN: Dict[Any, int] = {-3: 16, -4: 24, -5: 32}  # A128KW, A192KW, A256KW
+_KW_WRAP = COSE_KEY_OPERATION_VALUES["wrapKey"]
+_KW_UNWRAP = COSE_KEY_OPERATION_VALUES["unwrapKey"]
+
+
+def _evp_aes_key_wrap(cipher: Any, kek: bytes, data: bytes, enc: int) -> bytes:
+    """
+    Wraps (enc=1) or unwraps (enc=0) a key with OpenSSL's native AES key wrap
+    (RFC 3394) in a single call.
+    """
+    ctx = _ffi.gc(_lib.EVP_CIPHER_CTX_new(), _lib.EVP_CIPHER_CTX_free)
+    buf = _ffi.new("unsigned char[]", len(data) + 8)
+    outlen = _ffi.new("int *")
+    try:
+        if _lib.EVP_CipherInit_ex(ctx, cipher, _ffi.NULL, kek, _ffi.NULL, enc) != 1:
+            _lib.ERR_clear_error()
+            raise ValueError("Failed to initialize AES key wrap.")
+        if _lib.EVP_CipherUpdate(ctx, buf, outlen, data, len(data)) <= 0:
+            _lib.ERR_clear_error()
+            raise ValueError("Failed to process AES key wrap.")
+        if outlen[0] != len(data) + (8 if enc else -8):
+            raise ValueError("Invalid length of data for AES key wrap.")
+        return _ffi.buffer(buf, outlen[0])[:]
+    finally:
+        # Do not leave the KEK schedule or the (un)wrapped key behind.
+        _lib.EVP_CIPHER_CTX_reset(ctx)
+        _ffi.memmove(buf, bytes(len(buf)), len(buf))
+
+
+def _probe_evp_aes_wrap_ciphers():
+    """
+    Keeps only the native ciphers that actually work with this OpenSSL build
+    (e.g., OpenSSL 1.1 rejects them without EVP_CIPHER_CTX_FLAG_WRAP_ALLOW) so
+    that wrap_key/unwrap_key can choose between them and cryptography's
+    implementation without trying both on every call.
+    """
+    for alg, cipher in list(_EVP_AES_WRAP_CIPHERS.items()):
+        try:
+            _evp_aes_key_wrap(cipher, bytes(_KW_KEY_LEN[alg]), bytes(16), 1)
+        except Exception:
+            del _EVP_AES_WRAP_CIPHERS[alg]
+
+
+_probe_evp_aes_wrap_ciphers()
 
 
 class SymmetricKey(COSEKeyInterface):
@@ -340,36 +417,26 @@ class ChaCha20Key(ContentEncryptionKey):
 
 
 class AESKeyWrap(SymmetricKey):
-    _ACCEPTABLE_KEY_OPS = [
-        COSE_KEY_OPERATION_VALUES["wrapKey"],
-        COSE_KEY_OPERATION_VALUES["unwrapKey"],
-    ]
+    _ACCEPTABLE_KEY_OPS = frozenset((_KW_WRAP, _KW_UNWRAP))
 
     def __init__(self, params: Dict[int, Any]):
         super().__init__(params)
 
         # Validate alg.
-        if self._alg == -3:  # A128KW
-            if self._key and len(self._key) != 16:
-                raise ValueError(f"Invalid key length: {len(self._key)}.")
-            if not self._key:
-                self._key = token_bytes(16)
-        elif self._alg == -4:  # A192KW
-            if self._key and len(self._key) != 24:
-                raise ValueError(f"Invalid key length: {len(self._key)}.")
-            if not self._key:
-                self._key = token_bytes(24)
-        elif self._alg == -5:  # A256KW
-            if self._key and len(self._key) != 32:
-                raise ValueError(f"Invalid key length: {len(self._key)}.")
-            if not self._key:
-                self._key = token_bytes(32)
-        else:
+        expected = _KW_KEY_LEN.get(self._alg)
+        if expected is None:
             raise ValueError(f"Unknown alg(3) for AES key wrap: {self._alg}.")
+        if self._key and len(self._key) != expected:
+            raise ValueError(f"Invalid key length: {len(self._key)}.")
+        if not self._key:
+            self._key = token_bytes(expected)
+
+        # OpenSSL's native AES key wrap cipher (None if unavailable).
+        self._evp_cipher = _EVP_AES_WRAP_CIPHERS.get(self._alg)
 
         # Validate key_opt.
         if not self._key_ops:
-            self._key_ops = AESKeyWrap._ACCEPTABLE_KEY_OPS
+            self._key_ops = [_KW_WRAP, _KW_UNWRAP]
             return
         not_acceptable = [
             ops for ops in self._key_ops if ops not in AESKeyWrap._ACCEPTABLE_KEY_OPS
@@ -381,12 +448,16 @@ class AESKeyWrap(SymmetricKey):
 
     def wrap_key(self, key_to_wrap: bytes) -> bytes:
         try:
+            if self._evp_cipher is not None:
+                return _evp_aes_key_wrap(self._evp_cipher, self._key, key_to_wrap, 1)
             return aes_key_wrap(self._key, key_to_wrap)
         except Exception as err:
             raise EncodeError("Failed to wrap key.") from err
 
     def unwrap_key(self, wrapped_key: bytes) -> bytes:
         try:
+            if self._evp_cipher is not None:
+                return _evp_aes_key_wrap(self._evp_cipher, self._key, wrapped_key, 0)
             return aes_key_unwrap(self._key, wrapped_key)
         except Exception as err:
             raise DecodeError("Failed to unwrap key.") from err
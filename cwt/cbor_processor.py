@@ -7,6 +7,8 @@ from .exceptions import DecodeError, EncodeError
 
 
 class CBORProcessor:
+    __slots__ = ()
+
     def _dumps(self, obj: Any) -> bytes:
         try:
             return dumps(obj)
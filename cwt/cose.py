@@ -382,9 +382,8 @@ class COSE(CBORProcessor):
 
         if data.tag == 16:
             keys = self._filter_by_key_ops(keys, 4)
-            if not isinstance(data.value, list) or len(data.value) != 3:
-                raise ValueError("Invalid Encrypt0 format.")
-        elif data.tag == 96:
+            return self._decode_encrypt0(data.value, keys, external_aad)
+        if data.tag == 96:
             keys = self._filter_by_key_ops(keys, 4)
             if not isinstance(data.value, list) or len(data.value) != 4:
                 raise ValueError("Invalid Encrypt format.")
@@ -415,27 +414,6 @@ class COSE(CBORProcessor):
 
         err: Exception = ValueError("key is not found.")
 
-        # Encrypt0
-        if data.tag == 16:
-            kid = self._get_kid(protected, unprotected)
-            aad = self._dumps(["Encrypt0", data.value[0], external_aad])
-            nonce = unprotected.get(5, None)
-            if kid:
-                for i, k in enumerate(keys):
-                    if k.kid != kid:
-                        continue
-                    try:
-                        return k.decrypt(data.value[2], nonce, aad)
-                    except Exception as e:
-                        err = e
-                raise err
-            for i, k in enumerate(keys):
-                try:
-                    return k.decrypt(data.value[2], nonce, aad)
-                except Exception as e:
-                    err = e
-            raise err
-
         # Encrypt
         if data.tag == 96:
             aad = self._dumps(["Encrypt", data.value[0], external_aad])
@@ -552,6 +530,41 @@ class COSE(CBORProcessor):
                     err = e
         raise err
 
+    def _decode_encrypt0(
+        self, data: Any, keys: List[COSEKeyInterface], external_aad: bytes = b""
+    ) -> bytes:
+        if not isinstance(data, list) or len(data) != 3:
+            raise ValueError("Invalid Encrypt0 format.")
+        protected = self._loads(data[0]) if data[0] else b""
+        unprotected = data[1]
+        if not isinstance(unprotected, dict):
+            raise ValueError("unprotected header should be dict.")
+
+        err: Exception = ValueError("key is not found.")
+        kid = self._get_kid(protected, unprotected)
+        aad = self._dumps(["Encrypt0", data[0], external_aad])
+        nonce = unprotected.get(5, None)
+        if kid:
+            for i, k in enumerate(keys):
+                if k.kid != kid:
+                    continue
+                try:
+                    return k.decrypt(data[2], nonce, aad)
+                except Exception as e:
+                    err = e
+            raise err
+        for i, k in enumerate(keys):
+            try:
+                return k.decrypt(data[2], nonce, aad)
+            except Exception as e:
+                err = e
+        raise err
+
+    def _decode_encrypt0_to_dict(
+        self, data: Any, keys: List[COSEKeyInterface], external_aad: bytes = b""
+    ) -> Dict[int, Any]:
+        return self._loads(self._decode_encrypt0(data, keys, external_aad))
+
     def _filter_by_key_ops(
         self, keys: List[COSEKeyInterface], op: int
     ) -> List[COSEKeyInterface]:
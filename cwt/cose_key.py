@@ -29,6 +29,14 @@ from .const import (
 from .cose_key_interface import COSEKeyInterface
 from .utils import jwk_to_cose_key_params, uint_to_bytes
 
+_SYMMETRIC_KEY_CLASSES: Dict[Any, Any] = {
+    **{alg: AESGCMKey for alg in [1, 2, 3]},
+    **{alg: HMACKey for alg in [4, 5, 6, 7]},
+    **{alg: AESCCMKey for alg in [10, 11, 12, 13, 30, 31, 32, 33]},
+    24: ChaCha20Key,
+    **{alg: AESKeyWrap for alg in [-3, -4, -5]},
+}
+
 
 class COSEKey:
     """
@@ -65,17 +73,10 @@ class COSEKey:
                 not isinstance(params[3], int) and not isinstance(params[3], str)
             ):
                 raise ValueError("alg(3) should be int or str(tstr).")
-            if params[3] in [1, 2, 3]:
-                return AESGCMKey(params)
-            if params[3] in [4, 5, 6, 7]:
-                return HMACKey(params)
-            if params[3] in [10, 11, 12, 13, 30, 31, 32, 33]:
-                return AESCCMKey(params)
-            if params[3] == 24:
-                return ChaCha20Key(params)
-            if params[3] in [-3, -4, -5]:
-                return AESKeyWrap(params)
-            raise ValueError(f"Unsupported or unknown alg(3): {params[3]}.")
+            key_class = _SYMMETRIC_KEY_CLASSES.get(params[3])
+            if key_class is None:
+                raise ValueError(f"Unsupported or unknown alg(3): {params[3]}.")
+            return key_class(params)
         raise ValueError(f"Unsupported or unknown kty(1): {params[1]}.")
 
     @classmethod
@@ -136,6 +137,21 @@ class COSEKey:
         params[4] = key_ops_labels
         return cls.new(params)
 
+    @staticmethod
+    def _from_trusted_symmetric(k: bytes, alg: int, kid: bytes) -> COSEKeyInterface:
+        """
+        Creates a symmetric COSE key from already-normalized arguments (e.g., a
+        key just unwrapped by a recipient) without the argument conversions of
+        from_symmetric_key(). The key class still validates the key itself.
+        """
+        key_class = _SYMMETRIC_KEY_CLASSES.get(alg)
+        if key_class is None:
+            raise ValueError(f"Unsupported or unknown alg(3): {alg}.")
+        params: Dict[int, Any] = {1: 4, 3: alg, -1: k}
+        if kid:
+            params[2] = kid
+        return key_class(params)
+
     @classmethod
     def from_bytes(cls, key_data: bytes) -> COSEKeyInterface:
         """
@@ -13,6 +13,10 @@ class COSEKeyInterface(CBORProcessor):
     The interface class for a COSE Key used for MAC, signing/verifying and encryption/decryption.
     """
 
+    # CBOR-encoded to_dict() result cached by _cache_cbor(). COSE keys have no
+    # mutators after construction, so the cache never needs to be invalidated.
+    _cached_cbor: Optional[bytes] = None
+
     def __init__(self, params: Dict[int, Any]):
         """
         Constructor.
@@ -131,6 +135,10 @@ class COSEKeyInterface(CBORProcessor):
             res[5] = self._base_iv
         return res
 
+    def _cache_cbor(self, b: bytes) -> bytes:
+        self._cached_cbor = b
+        return b
+
     def generate_nonce(self) -> bytes:
         """
         Returns a nonce with the size suitable for the algorithm.
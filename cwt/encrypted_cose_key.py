@@ -1,19 +1,28 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
-import cbor2
-from cbor2 import CBORTag
+from cbor2 import CBORTag, dumps
 
 from .cbor_processor import CBORProcessor
+from .const import COSE_ALGORITHMS_CEK
 from .cose import COSE
 from .cose_key import COSEKey
 from .cose_key_interface import COSEKeyInterface
 
+# Pre-serialized protected headers ({1: alg}) for content encryption algorithms.
+_PROTECTED_TEMPLATES: Dict[Any, bytes] = {
+    alg: dumps({1: alg}) for alg in COSE_ALGORITHMS_CEK.values()
+}
+
 
 class EncryptedCOSEKey(CBORProcessor):
     """
     An encrypted COSE key.
     """
 
+    __slots__ = ()
+
+    _cose = COSE()
+
     @staticmethod
     def from_cose_key(
         key: COSEKeyInterface,
@@ -37,10 +46,8 @@ class EncryptedCOSEKey(CBORProcessor):
             ValueError: Invalid arguments.
             EncodeError: Failed to encrypt the COSE key.
         """
-        protected: Dict[int, Any] = {1: encryption_key.alg}
-        unprotected: Dict[int, Any] = (
-            {4: encryption_key.kid} if encryption_key.kid else {}
-        )
+        alg = encryption_key.alg
+        protected = _PROTECTED_TEMPLATES.get(alg) or dumps({1: alg})
         if not nonce:
             try:
                 nonce = encryption_key.generate_nonce()
@@ -48,9 +55,10 @@ class EncryptedCOSEKey(CBORProcessor):
                 raise ValueError(
                     "Nonce generation is not supported for the key. Set a nonce explicitly."
                 )
-        unprotected[5] = nonce
-        b_payload = cbor2.dumps(key.to_dict())
-        res: CBORTag = COSE().encode_and_encrypt(
+        kid = encryption_key.kid
+        unprotected: Dict[int, Any] = {4: kid, 5: nonce} if kid else {5: nonce}
+        b_payload = key._cached_cbor or key._cache_cbor(dumps(key.to_dict()))
+        res: CBORTag = EncryptedCOSEKey._cose.encode_and_encrypt(
             b_payload,
             encryption_key,
             protected,
@@ -60,6 +68,51 @@ class EncryptedCOSEKey(CBORProcessor):
         )
         return res.value
 
+    @staticmethod
+    def from_cose_keys(
+        keys: List[COSEKeyInterface],
+        encryption_key: COSEKeyInterface,
+        nonces: Optional[List[bytes]] = None,
+    ) -> List[List[Any]]:
+        """
+        Returns a list of encrypted COSE keys formatted to COSE_Encrypt0 structure.
+        The result is the same as calling ``from_cose_key`` for each key, but the
+        protected header and the Enc_structure are built only once.
+
+        Args:
+            keys: List[COSEKeyInterface]: Keys to be encrypted.
+            encryption_key: COSEKeyInterface: An encryption key to encrypt the
+                target COSE keys.
+            nonces (Optional[List[bytes]]): Nonces for encryption. If specified,
+                it should have the same length as ``keys``.
+        Returns:
+            List[List[Any]]: COSE_Encrypt0 structures of the target COSE keys.
+        Raises:
+            ValueError: Invalid arguments.
+            EncodeError: Failed to encrypt the COSE keys.
+        """
+        if nonces is not None and len(nonces) != len(keys):
+            raise ValueError("The length of nonces should be the same as keys.")
+        alg = encryption_key.alg
+        b_protected = _PROTECTED_TEMPLATES.get(alg) or dumps({1: alg})
+        aad = dumps(["Encrypt0", b_protected, b""])
+        kid = encryption_key.kid
+        encrypt = encryption_key.encrypt
+        res = []
+        for i, key in enumerate(keys):
+            nonce = nonces[i] if nonces is not None else b""
+            if not nonce:
+                try:
+                    nonce = encryption_key.generate_nonce()
+                except NotImplementedError:
+                    raise ValueError(
+                        "Nonce generation is not supported for the key. Set a nonce explicitly."
+                    )
+            unprotected: Dict[int, Any] = {4: kid, 5: nonce} if kid else {5: nonce}
+            b_payload = key._cached_cbor or key._cache_cbor(dumps(key.to_dict()))
+            res.append([b_protected, unprotected, encrypt(b_payload, nonce, aad)])
+        return res
+
     @staticmethod
     def to_cose_key(
         key: List[Any], encryption_key: COSEKeyInterface
@@ -77,5 +130,32 @@ class EncryptedCOSEKey(CBORProcessor):
             DecodeError: Failed to decode the COSE key.
             VerifyError: Failed to verify the COSE key.
         """
-        res = cbor2.loads(COSE().decode(CBORTag(16, key), encryption_key))
+        if not isinstance(encryption_key, COSEKeyInterface):
+            raise ValueError("key in keys should have COSEKeyInterface.")
+        res = EncryptedCOSEKey._cose._decode_encrypt0_to_dict(key, [encryption_key])
         return COSEKey.new(res)
+
+    @staticmethod
+    def to_cose_keys(
+        keys: List[List[Any]], encryption_key: COSEKeyInterface
+    ) -> List[COSEKeyInterface]:
+        """
+        Returns a list of decrypted COSE keys.
+
+        Args:
+            keys: List[List[Any]]: Keys formatted to COSE_Encrypt0 structure to be decrypted.
+            encryption_key: COSEKeyInterface: An encryption key to decrypt the target COSE keys.
+        Returns:
+            List[COSEKeyInterface]: Keys decrypted.
+        Raises:
+            ValueError: Invalid arguments.
+            DecodeError: Failed to decode the COSE keys.
+            VerifyError: Failed to verify the COSE keys.
+        """
+        if not isinstance(encryption_key, COSEKeyInterface):
+            raise ValueError("key in keys should have COSEKeyInterface.")
+        cose = EncryptedCOSEKey._cose
+        enc_keys = [encryption_key]
+        return [
+            COSEKey.new(cose._decode_encrypt0_to_dict(key, enc_keys)) for key in keys
+        ]
@@ -6,12 +6,14 @@ from ..cose_key_interface import COSEKeyInterface
 from ..exceptions import DecodeError, EncodeError
 from ..recipient_interface import RecipientInterface
 
+_WRAP = COSE_KEY_OPERATION_VALUES["wrapKey"]
+_UNWRAP = COSE_KEY_OPERATION_VALUES["unwrapKey"]
+
 
 class AESKeyWrap(RecipientInterface):
-    _ACCEPTABLE_KEY_OPS = [
-        COSE_KEY_OPERATION_VALUES["wrapKey"],
-        COSE_KEY_OPERATION_VALUES["unwrapKey"],
-    ]
+    __slots__ = ("_sender_key",)
+
+    _ACCEPTABLE_KEY_OPS = frozenset((_WRAP, _UNWRAP))
 
     def __init__(
         self,
@@ -19,7 +21,7 @@ class AESKeyWrap(RecipientInterface):
         unprotected: Dict[int, Any],
         sender_key: COSEKeyInterface,
         ciphertext: bytes = b"",
-        recipients: List[Any] = [],
+        recipients: Optional[List[Any]] = None,
     ):
         if sender_key.alg not in [-3, -4, -5]:
             raise ValueError(f"Invalid alg in sender_key: {sender_key.alg}.")
@@ -62,6 +64,6 @@ class AESKeyWrap(RecipientInterface):
             raise ValueError("alg should be set.")
         try:
             unwrapped = key.unwrap_key(self._ciphertext)
-            return COSEKey.from_symmetric_key(unwrapped, alg=alg, kid=self._kid)
+            return COSEKey._from_trusted_symmetric(unwrapped, alg, self._kid)
         except Exception as err:
             raise DecodeError("Failed to decode key.") from err
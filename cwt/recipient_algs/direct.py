@@ -1,15 +1,17 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..recipient_interface import RecipientInterface
 
 
 class Direct(RecipientInterface):
+    __slots__ = ()
+
     def __init__(
         self,
         protected: Dict[int, Any],
         unprotected: Dict[int, Any],
         ciphertext: bytes = b"",
-        recipients: List[Any] = [],
+        recipients: Optional[List[Any]] = None,
     ):
         super().__init__(protected, unprotected, ciphertext, recipients)
 
@@ -14,6 +14,8 @@ from .direct import Direct
 
 
 class DirectHKDF(Direct):
+    __slots__ = ("_salt", "_default_ctx", "_applied_ctx", "_hash_alg")
+
     _ACCEPTABLE_KEY_OPS = [
         COSE_KEY_OPERATION_VALUES["deriveKey"],
         COSE_KEY_OPERATION_VALUES["deriveBits"],
@@ -24,7 +26,7 @@ class DirectHKDF(Direct):
         protected: Dict[int, Any],
         unprotected: Dict[int, Any],
         ciphertext: bytes = b"",
-        recipients: List[Any] = [],
+        recipients: Optional[List[Any]] = None,
     ):
         super().__init__(protected, unprotected, ciphertext, recipients)
 
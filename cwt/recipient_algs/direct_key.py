@@ -5,11 +5,13 @@ from .direct import Direct
 
 
 class DirectKey(Direct):
+    __slots__ = ()
+
     def __init__(
         self,
         unprotected: Dict[int, Any],
         ciphertext: bytes = b"",
-        recipients: List[Any] = [],
+        recipients: Optional[List[Any]] = None,
     ):
         super().__init__({}, unprotected, ciphertext, recipients)
 
@@ -10,6 +10,8 @@ from ..recipient_interface import RecipientInterface
 
 
 class ECDH_AESKeyWrap(RecipientInterface):
+    __slots__ = ("_sender_public_key", "_sender_key", "_apu", "_apv")
+
     _ACCEPTABLE_KEY_OPS = [
         COSE_KEY_OPERATION_VALUES["deriveKey"],
         COSE_KEY_OPERATION_VALUES["deriveBits"],
@@ -20,7 +22,7 @@ class ECDH_AESKeyWrap(RecipientInterface):
         protected: Dict[int, Any],
         unprotected: Dict[int, Any],
         ciphertext: bytes = b"",
-        recipients: List[Any] = [],
+        recipients: Optional[List[Any]] = None,
         sender_key: Optional[COSEKeyInterface] = None,
     ):
         super().__init__(protected, unprotected, ciphertext, recipients)
@@ -10,6 +10,14 @@ from .direct import Direct
 
 
 class ECDH_DirectHKDF(Direct):
+    __slots__ = (
+        "_sender_public_key",
+        "_sender_key",
+        "_salt",
+        "_default_ctx",
+        "_applied_ctx",
+    )
+
     _ACCEPTABLE_KEY_OPS = [
         COSE_KEY_OPERATION_VALUES["deriveKey"],
         COSE_KEY_OPERATION_VALUES["deriveBits"],
@@ -20,7 +28,7 @@ class ECDH_DirectHKDF(Direct):
         protected: Dict[int, Any],
         unprotected: Dict[int, Any],
         ciphertext: bytes = b"",
-        recipients: List[Any] = [],
+        recipients: Optional[List[Any]] = None,
         sender_key: Optional[COSEKeyInterface] = None,
     ):
         super().__init__(protected, unprotected, ciphertext, recipients)
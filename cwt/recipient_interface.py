@@ -15,13 +15,23 @@ class RecipientInterface(CBORProcessor):
     The interface class for a COSE Recipient.
     """
 
+    __slots__ = (
+        "_alg",
+        "_kid",
+        "_protected",
+        "_unprotected",
+        "_ciphertext",
+        "_key",
+        "_recipients",
+    )
+
     def __init__(
         self,
         protected: Optional[Dict[int, Any]] = None,
         unprotected: Optional[Dict[int, Any]] = None,
         ciphertext: bytes = b"",
-        recipients: List[Any] = [],
-        key_ops: List[int] = [],
+        recipients: Optional[List[Any]] = None,
+        key_ops: Optional[List[int]] = None,
         key: bytes = b"",
     ):
 
@@ -34,12 +44,13 @@ class RecipientInterface(CBORProcessor):
             unprotected (Optional[Dict[int, Any]]): Parameters that are not cryptographically
                 protected.
             ciphertext: A ciphertext encoded as bytes.
-            recipients: A list of recipient information structures.
-            key_ops: A list of operations that the key is to be used for.
+            recipients (Optional[List[Any]]): A list of recipient information structures.
+            key_ops (Optional[List[int]]): A list of operations that the key is to be used for.
             key: A body of the key as bytes.
         """
         protected = {} if protected is None else protected
         unprotected = {} if unprotected is None else unprotected
+        recipients = [] if recipients is None else recipients
         self._alg = 0
 
         # kid
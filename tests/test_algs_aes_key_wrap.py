@@ -3,9 +3,11 @@ Tests for KeyWrap.
 """
 
 import pytest
+from cryptography.hazmat.primitives.keywrap import aes_key_wrap
 
-from cwt.algs.symmetric import AESKeyWrap
-from cwt.exceptions import DecodeError
+import cwt.algs.symmetric
+from cwt.algs.symmetric import AESKeyWrap, _probe_evp_aes_wrap_ciphers
+from cwt.exceptions import DecodeError, EncodeError
 
 
 class TestAESKeyWrap:
@@ -27,6 +29,13 @@ class TestAESKeyWrap:
         assert isinstance(key, AESKeyWrap)
         assert key.alg == -5
 
+    def test_aes_key_wrap_constructor_with_default_key_ops(self):
+        key1 = AESKeyWrap({1: 4, 3: -3})
+        key2 = AESKeyWrap({1: 4, 3: -3})
+        assert key1.key_ops == [5, 6]
+        assert key1.to_dict()[4] == [5, 6]
+        assert key1.key_ops is not key2.key_ops
+
     def test_aes_key_wrap_constructor_with_invalid_alg(self):
         with pytest.raises(ValueError) as err:
             AESKeyWrap({1: 4, 3: 1})
@@ -47,3 +56,121 @@ class TestAESKeyWrap:
             key.unwrap_key(b"")
             pytest.fail("unwrap_key() should fail.")
         assert "Failed to unwrap key." in str(err.value)
+
+    @pytest.mark.parametrize(
+        "alg, kek, key_data, wrapped",
+        [
+            (
+                -3,
+                "000102030405060708090A0B0C0D0E0F",
+                "00112233445566778899AABBCCDDEEFF",
+                "1FA68B0A8112B447AEF34BD8FB5A7B829D3E862371D2CFE5",
+            ),
+            (
+                -4,
+                "000102030405060708090A0B0C0D0E0F1011121314151617",
+                "00112233445566778899AABBCCDDEEFF",
+                "96778B25AE6CA435F92B5B97C050AED2468AB8A17AD84E5D",
+            ),
+            (
+                -5,
+                "000102030405060708090A0B0C0D0E0F101112131415161718191A1B1C1D1E1F",
+                "00112233445566778899AABBCCDDEEFF0001020304050607",
+                "A8F9BC1612C68B3FF6E6F4FBE30E71E4769C8B80A32CB8958CD5D17D6B254DA1",
+            ),
+        ],
+    )
+    def test_aes_key_wrap_wrap_and_unwrap_key_with_rfc3394_vectors(
+        self, alg, kek, key_data, wrapped
+    ):
+        key = AESKeyWrap({1: 4, 3: alg, -1: bytes.fromhex(kek)})
+        assert key.wrap_key(bytes.fromhex(key_data)) == bytes.fromhex(wrapped)
+        assert key.unwrap_key(bytes.fromhex(wrapped)) == bytes.fromhex(key_data)
+
+    @pytest.mark.parametrize(
+        "alg, kek, key_data, wrapped",
+        [
+            (
+                -3,
+                "000102030405060708090A0B0C0D0E0F",
+                "00112233445566778899AABBCCDDEEFF",
+                "1FA68B0A8112B447AEF34BD8FB5A7B829D3E862371D2CFE5",
+            ),
+            (
+                -5,
+                "000102030405060708090A0B0C0D0E0F101112131415161718191A1B1C1D1E1F",
+                "00112233445566778899AABBCCDDEEFF000102030405060708090A0B0C0D0E0F",
+                "28C9F404C4B810F4CBCCB35CFB87F8263F5786E2D80ED326CBC7F0E71A99F43BFB988B9B7A02DD21",
+            ),
+        ],
+    )
+    def test_aes_key_wrap_wrap_and_unwrap_key_without_evp_cipher(
+        self, monkeypatch, alg, kek, key_data, wrapped
+    ):
+        monkeypatch.setattr("cwt.algs.symmetric._EVP_AES_WRAP_CIPHERS", {})
+        key = AESKeyWrap({1: 4, 3: alg, -1: bytes.fromhex(kek)})
+        assert key._evp_cipher is None
+        assert key.wrap_key(bytes.fromhex(key_data)) == bytes.fromhex(wrapped)
+        assert key.unwrap_key(bytes.fromhex(wrapped)) == bytes.fromhex(key_data)
+
+    @pytest.mark.parametrize("wrapped", [b"", bytes(16), bytes(25), bytes(24)])
+    def test_aes_key_wrap_unwrap_key_without_evp_cipher_with_invalid_data(
+        self, monkeypatch, wrapped
+    ):
+        monkeypatch.setattr("cwt.algs.symmetric._EVP_AES_WRAP_CIPHERS", {})
+        key = AESKeyWrap({1: 4, 3: -3})
+        with pytest.raises(DecodeError) as err:
+            key.unwrap_key(wrapped)
+            pytest.fail("unwrap_key() should fail.")
+        assert "Failed to unwrap key." in str(err.value)
+
+    def test_aes_key_wrap_wrap_key_without_evp_cipher_with_invalid_length(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr("cwt.algs.symmetric._EVP_AES_WRAP_CIPHERS", {})
+        key = AESKeyWrap({1: 4, 3: -3})
+        with pytest.raises(EncodeError) as err:
+            key.wrap_key(b"01234567")
+            pytest.fail("wrap_key() should fail.")
+        assert "Failed to wrap key." in str(err.value)
+
+    def test_aes_key_wrap_probe_without_evp_bindings(self, monkeypatch):
+        class _LibWithoutEVPCipherCtx:
+            def EVP_get_cipherbyname(self, name):
+                return name
+
+        monkeypatch.setattr(
+            "cwt.algs.symmetric._EVP_AES_WRAP_CIPHERS",
+            {-3: b"id-aes128-wrap", -5: b"id-aes256-wrap"},
+        )
+        monkeypatch.setattr("cwt.algs.symmetric._lib", _LibWithoutEVPCipherCtx())
+        _probe_evp_aes_wrap_ciphers()
+        assert cwt.algs.symmetric._EVP_AES_WRAP_CIPHERS == {}
+        key = AESKeyWrap({1: 4, 3: -3})
+        assert key._evp_cipher is None
+        wrapped = key.wrap_key(bytes(16))
+        assert wrapped == aes_key_wrap(key.key, bytes(16))
+        assert key.unwrap_key(wrapped) == bytes(16)
+
+    def test_aes_key_wrap_wrap_key_with_invalid_length(self):
+        key = AESKeyWrap({1: 4, 3: -3})
+        with pytest.raises(EncodeError) as err:
+            key.wrap_key(b"0123456789")
+            pytest.fail("wrap_key() should fail.")
+        assert "Failed to wrap key." in str(err.value)
+
+    def test_aes_key_wrap_unwrap_key_with_tampered_data(self):
+        key = AESKeyWrap({1: 4, 3: -3})
+        wrapped = bytearray(key.wrap_key(b"0123456789abcdef"))
+        wrapped[0] ^= 1
+        with pytest.raises(DecodeError) as err:
+            key.unwrap_key(bytes(wrapped))
+            pytest.fail("unwrap_key() should fail.")
+        assert "Failed to unwrap key." in str(err.value)
+
+    def test_aes_key_wrap_wrap_and_unwrap_keys_with_various_lengths(self):
+        key = AESKeyWrap({1: 4, 3: -5})
+        for n in [16, 64, 128, 24]:
+            wrapped = key.wrap_key(bytes(range(n)))
+            assert len(wrapped) == n + 8
+            assert key.unwrap_key(wrapped) == bytes(range(n))
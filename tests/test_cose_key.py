@@ -128,6 +128,38 @@ class TestCOSEKey:
             pytest.fail("from_symmetric_key should fail.")
         assert f"Unsupported or unknown alg(3): {alg}." in str(err.value)
 
+    @pytest.mark.parametrize(
+        "alg, key_len, kid",
+        [
+            (1, 16, b"01"),
+            (5, 32, b""),
+            (10, 16, b"01"),
+            (24, 32, b"01"),
+            (-5, 32, b""),
+        ],
+    )
+    def test_key_builder_from_trusted_symmetric(self, alg, key_len, kid):
+        k = COSEKey._from_trusted_symmetric(b"x" * key_len, alg, kid)
+        expected = COSEKey.from_symmetric_key(b"x" * key_len, alg=alg, kid=kid)
+        assert type(k) is type(expected)
+        assert k.to_dict() == expected.to_dict()
+
+    @pytest.mark.parametrize(
+        "alg",
+        [0, 8, 9, 34],
+    )
+    def test_key_builder_from_trusted_symmetric_with_invalid_alg(self, alg):
+        with pytest.raises(ValueError) as err:
+            COSEKey._from_trusted_symmetric(b"x" * 16, alg, b"")
+            pytest.fail("_from_trusted_symmetric should fail.")
+        assert f"Unsupported or unknown alg(3): {alg}." in str(err.value)
+
+    def test_key_builder_from_trusted_symmetric_with_invalid_key_length(self):
+        with pytest.raises(ValueError) as err:
+            COSEKey._from_trusted_symmetric(b"x" * 24, 1, b"")
+            pytest.fail("_from_trusted_symmetric should fail.")
+        assert "The length of A128GCM key should be 16 bytes." in str(err.value)
+
     @pytest.mark.parametrize(
         "key_ops",
         [["xxx"], ["MAC create", "MAC verify", "xxx"]],
@@ -3,7 +3,7 @@ from secrets import token_bytes
 import cbor2
 import pytest
 
-from cwt import COSEKey, EncryptedCOSEKey
+from cwt import COSE, COSEKey, DecodeError, EncryptedCOSEKey
 
 
 class TestEncryptedCOSEKey:
@@ -33,3 +33,100 @@ class TestEncryptedCOSEKey:
             "Nonce generation is not supported for the key. Set a nonce explicitly."
             in str(err.value)
         )
+
+    def test_encrypted_cose_key_to_cose_key(self):
+        enc_key = COSEKey.from_symmetric_key(alg="ChaCha20/Poly1305", kid="01")
+        pop_key = COSEKey.from_symmetric_key(alg="HMAC 256/256")
+        res = EncryptedCOSEKey.from_cose_key(pop_key, enc_key)
+        decoded = EncryptedCOSEKey.to_cose_key(res, enc_key)
+        assert decoded.to_dict() == pop_key.to_dict()
+
+    def test_encrypted_cose_key_to_cose_key_with_invalid_format(self):
+        enc_key = COSEKey.from_symmetric_key(alg="ChaCha20/Poly1305")
+        with pytest.raises(ValueError) as err:
+            EncryptedCOSEKey.to_cose_key([b"", {}], enc_key)
+            pytest.fail("to_cose_key() should fail.")
+        assert "Invalid Encrypt0 format." in str(err.value)
+
+    def test_encrypted_cose_key_from_cose_keys(self):
+        enc_key = COSEKey.from_symmetric_key(alg="A128GCM", kid="01")
+        pop_keys = [
+            COSEKey.from_symmetric_key(alg="HMAC 256/256"),
+            COSEKey.from_symmetric_key(alg="A128GCM"),
+        ]
+        nonces = [token_bytes(12), token_bytes(12)]
+        res = EncryptedCOSEKey.from_cose_keys(pop_keys, enc_key, nonces=nonces)
+        assert len(res) == 2
+        for i, r in enumerate(res):
+            assert r == EncryptedCOSEKey.from_cose_key(
+                pop_keys[i], enc_key, nonce=nonces[i]
+            )
+        decoded = EncryptedCOSEKey.to_cose_keys(res, enc_key)
+        assert [k.to_dict() for k in decoded] == [k.to_dict() for k in pop_keys]
+
+    def test_encrypted_cose_key_from_cose_keys_without_nonces(self):
+        enc_key = COSEKey.from_symmetric_key(alg="AES-CCM-16-64-128")
+        pop_keys = [COSEKey.from_symmetric_key(alg="HMAC 256/256") for _ in range(3)]
+        res = EncryptedCOSEKey.from_cose_keys(pop_keys, enc_key)
+        assert len({r[1][5] for r in res}) == 3
+        assert 4 not in res[0][1]
+        decoded = EncryptedCOSEKey.to_cose_keys(res, enc_key)
+        assert [k.key for k in decoded] == [k.key for k in pop_keys]
+
+    def test_encrypted_cose_key_from_cose_keys_with_invalid_nonces(self):
+        enc_key = COSEKey.from_symmetric_key(alg="ChaCha20/Poly1305")
+        pop_key = COSEKey.from_symmetric_key(alg="HMAC 256/256")
+        with pytest.raises(ValueError) as err:
+            EncryptedCOSEKey.from_cose_keys([pop_key], enc_key, nonces=[])
+            pytest.fail("from_cose_keys() should fail.")
+        assert "The length of nonces should be the same as keys." in str(err.value)
+
+    def test_encrypted_cose_key_from_cose_keys_with_invalid_encryption_key(self):
+        enc_key = COSEKey.from_symmetric_key(alg="HMAC 256/64")
+        pop_key = COSEKey.from_symmetric_key(alg="HMAC 256/256")
+        with pytest.raises(ValueError) as err:
+            EncryptedCOSEKey.from_cose_keys([pop_key], enc_key)
+            pytest.fail("from_cose_keys() should fail.")
+        assert (
+            "Nonce generation is not supported for the key. Set a nonce explicitly."
+            in str(err.value)
+        )
+
+    def test_encrypted_cose_key_from_cose_key_caches_serialized_key(self):
+        enc_key1 = COSEKey.from_symmetric_key(alg="A128GCM")
+        enc_key2 = COSEKey.from_symmetric_key(alg="ChaCha20/Poly1305")
+        pop_key = COSEKey.from_symmetric_key(alg="HMAC 256/256")
+        assert pop_key._cached_cbor is None
+        res1 = EncryptedCOSEKey.from_cose_key(pop_key, enc_key1)
+        assert pop_key._cached_cbor == cbor2.dumps(pop_key.to_dict())
+        res2 = EncryptedCOSEKey.from_cose_key(pop_key, enc_key2)
+        assert EncryptedCOSEKey.to_cose_key(res1, enc_key1).key == pop_key.key
+        assert EncryptedCOSEKey.to_cose_key(res2, enc_key2).key == pop_key.key
+
+    def test_encrypted_cose_key_to_cose_key_with_invalid_payload(self):
+        enc_key = COSEKey.from_symmetric_key(alg="ChaCha20/Poly1305")
+        encoded = COSE().encode_and_encrypt(
+            b"\x5a", enc_key, {1: 24}, out="cbor2/CBORTag"
+        )
+        with pytest.raises(DecodeError) as err:
+            EncryptedCOSEKey.to_cose_key(encoded.value, enc_key)
+            pytest.fail("to_cose_key() should fail.")
+        assert "Failed to decode." in str(err.value)
+
+    def test_encrypted_cose_key_to_cose_key_with_invalid_encryption_key(self):
+        enc_key = COSEKey.from_symmetric_key(alg="ChaCha20/Poly1305")
+        pop_key = COSEKey.from_symmetric_key(alg="HMAC 256/256")
+        res = EncryptedCOSEKey.from_cose_key(pop_key, enc_key)
+        with pytest.raises(ValueError) as err:
+            EncryptedCOSEKey.to_cose_key(res, b"notakey")
+            pytest.fail("to_cose_key() should fail.")
+        assert "key in keys should have COSEKeyInterface." in str(err.value)
+
+    def test_encrypted_cose_key_to_cose_keys_with_invalid_encryption_key(self):
+        enc_key = COSEKey.from_symmetric_key(alg="ChaCha20/Poly1305")
+        pop_key = COSEKey.from_symmetric_key(alg="HMAC 256/256")
+        res = EncryptedCOSEKey.from_cose_keys([pop_key], enc_key)
+        with pytest.raises(ValueError) as err:
+            EncryptedCOSEKey.to_cose_keys(res, b"notakey")
+            pytest.fail("to_cose_keys() should fail.")
+        assert "key in keys should have COSEKeyInterface." in str(err.value)
@@ -23,6 +23,12 @@ class TestAESKeyWrap:
         assert isinstance(ctx, AESKeyWrap)
         assert ctx.alg == -3
 
+    def test_aes_key_wrap_constructor_without_instance_dict(self):
+        ctx = AESKeyWrap(
+            {1: -3}, {}, sender_key=COSEKey.from_symmetric_key(alg="A128KW")
+        )
+        assert not hasattr(ctx, "__dict__")
+
     def test_aes_key_wrap_constructor_a192kw(self):
         ctx = AESKeyWrap(
             {1: -4}, {}, sender_key=COSEKey.from_symmetric_key(alg="A192KW")